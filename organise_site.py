@@ -1,57 +1,167 @@
 #!/usr/bin/env python3
 import argparse
-import hashlib
+import asyncio
 import os
+import posixpath
 import re
 import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import unquote
 
+try:
+    import hyperscan
+except ImportError:  # optional, only speeds up the final audit
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:  # optional, only used with --audit-re2
+    re2 = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional, large rename maps fall back to one regex
+    ahocorasick = None
+
+try:
+    import aiofiles
+except ImportError:  # optional, --async-io falls back to asyncio.to_thread
+    aiofiles = None
+
 TEXT_EXTS = {".html", ".css", ".js", ".json", ".xml", ".txt", ".webmanifest", ".md"}
 BINARY_EXTS = {".png", ".jpg", ".jpeg", ".webp", ".svg", ".gif", ".mp4", ".webm", ".woff", ".woff2", ".ttf", ".otf", ".pdf"}
 
 ASSET_DIRS = {"img", "cards", "icons", "socials", "vids", "Documents"}
 
-# Matches:
+# Matches (in a single pass, one branch per form):
 #  - href="..."
 #  - src='...'
 #  - url(...)
 #  - JSON strings containing paths (we treat as plain text replacement)
-HREFSRC_RE = re.compile(r"""(?P<attr>\b(?:href|src)\s*=\s*["'])(?P<val>[^"']+)(?P<end>["'])""", re.IGNORECASE)
-CSSURL_RE  = re.compile(r"""(?P<pre>url\(\s*["']?)(?P<val>[^"')]+)(?P<end>["']?\s*\))""", re.IGNORECASE)
+# Keywords fold case in ASCII only (?a:...), so REF_HINT_RE below agrees.
+REF_RE = re.compile(
+    r"""(?P<attr>\b(?a:href|src)\s*=\s*["'])(?P<hval>[^"']+)(?P<hend>["'])"""
+    r"""|(?P<pre>(?a:url)\(\s*["']?)(?P<cval>[^"')]+)(?P<cend>["']?\s*\))""",
+    re.IGNORECASE,
+)
+
+# Cheap byte-level test for "could REF_RE match anything at all"
+REF_HINT_RE = re.compile(rb"href|src|url\(", re.IGNORECASE)
+
+# Audit patterns (capture the raw reference only). These also run on
+# hyperscan and re2, whose \s and case folding differ from re's Unicode
+# rules, so whitespace and letter case are spelled out in ASCII.
+_AUDIT_WS = r"[\t\n\x0b\x0c\r ]*"
+AUDIT_HREFSRC_RE = re.compile(r"(?:[Hh][Rr][Ee][Ff]|[Ss][Rr][Cc])" + _AUDIT_WS + "=" + _AUDIT_WS + r'''["']([^"']+)["']''')
+AUDIT_CSSURL_RE  = re.compile(r"[Uu][Rr][Ll]\(" + _AUDIT_WS + r'''["']?([^"')]+)["']?''' + _AUDIT_WS + r"\)")
+
+# pattern source -> (hyperscan db, bytes pattern), built on first use
+_HS_AUDIT = {}
+# pattern source -> re2 pattern, built on first use
+_RE2_AUDIT = {}
+
+# Small helpers used per reference / per filename
+_WS_RE       = re.compile(r"\s+")
+_NONSAFE_RE  = re.compile(r"[^a-zA-Z0-9.\-\/]+")
+_DUPDASH_RE  = re.compile(r"-{2,}")
+_DOTDOT_RE   = re.compile(r"^\.\.//+")
+_DUPSLASH_RE = re.compile(r"//+")
+# Names kebab() leaves untouched: safe chars, single dashes, no edge dashes
+_KEBAB_CLEAN_RE = re.compile(r"(?:[A-Za-z0-9.]+-)*[A-Za-z0-9.]+")
+
+# Bare filenames with these extensions are assumed to live in the site root
+ROOT_ASSET_EXTS = frozenset({".jpg", ".jpeg", ".png", ".webp", ".svg", ".gif", ".mp4", ".webm", ".pdf", ".css", ".js"})
+
+# Rename tokens above which pyahocorasick beats a regex alternation
+AHOCORASICK_MIN_TOKENS = 50
+
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# (root_resolved_str, repl, token_matcher, dry_run), set by _init_rewrite
+_rewrite_ctx = None
+
+# Cleared after the first failed clone so copy_site stops trying
+_reflink_supported = True
 
 SKIP_PREFIXES = ("http:", "https:", "mailto:", "tel:", "#", "data:", "javascript:")
 
-def sha256_file(p: Path) -> str:
-    h = hashlib.sha256()
-    with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
 def kebab(s: str) -> str:
     s = unquote(s)
     s = s.replace("_", "-")
-    s = re.sub(r"\s+", "-", s.strip())
-    s = re.sub(r"[^a-zA-Z0-9.\-\/]+", "-", s)
-    s = re.sub(r"-{2,}", "-", s)
+    s = _WS_RE.sub("-", s.strip())
+    s = _NONSAFE_RE.sub("-", s)
+    s = _DUPDASH_RE.sub("-", s)
     return s.strip("-")
 
+def _walk(root):
+    """
+    Yield os.DirEntry objects under root, in the same order as rglob("*").
+    DirEntry caches is_file()/is_dir(), so callers avoid a stat per path.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except FileNotFoundError:
+        return
+    yield from entries
+    for e in entries:
+        if e.is_dir(follow_symlinks=False):
+            yield from _walk(e.path)
+
+def rel_prefix(root: Path) -> str:
+    # Path() drops a leading "./" from listed files, so "." has no prefix
+    root_str = str(Path(root))
+    return "" if root_str == "." else os.path.join(root_str, "")
+
+def rel_posix(p: Path, prefix: str) -> str:
+    # p.relative_to(root).as_posix() for p under root, by slicing the string
+    rel = str(p)[len(prefix):]
+    return rel if os.sep == "/" else rel.replace(os.sep, "/")
+
+def list_files(root: Path) -> list:
+    return [Path(e.path) for e in _walk(root) if e.is_file()]
+
+def apply_map_to_files(root: Path, files: list, rename_map: dict) -> list:
+    """
+    Return the file list as it looks after apply_renames(root, rename_map).
+    """
+    if not rename_map:
+        return files
+    prefix = rel_prefix(root)
+    seen = set()
+    renamed = []
+    for p in files:
+        rel = rel_posix(p, prefix)
+        if rel in rename_map:
+            p = root / rename_map[rel]
+        if p not in seen:
+            seen.add(p)
+            renamed.append(p)
+    return renamed
+
 def is_text_file(p: Path) -> bool:
     return p.suffix.lower() in TEXT_EXTS
 
+def decode_text(raw: bytes) -> str:
+    # utf-8 ignoring errors, with universal newlines like open() in text mode
+    return raw.decode("utf-8", errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
+
 def read_text(p: Path) -> str:
-    return p.read_text(encoding="utf-8", errors="ignore")
+    return decode_text(p.read_bytes())
 
 def write_text(p: Path, s: str) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(s, encoding="utf-8", errors="ignore")
+    p.write_bytes(s.encode("utf-8", errors="ignore"))
 
-def safe_rel_to_root(site_root: Path, current_file: Path, ref: str) -> str:
+def safe_rel_to_root(site_root_resolved: Path, current_file: Path, ref: str) -> str:
     """
     Convert a reference into a root-absolute path where possible.
     This avoids /about/img/... type bugs on Netlify clean URLs.
+    site_root_resolved must already be resolved; callers resolve it once per run.
     """
     ref = ref.strip()
     if not ref or ref.startswith(SKIP_PREFIXES) or ref.startswith("${"):
@@ -62,18 +172,37 @@ def safe_rel_to_root(site_root: Path, current_file: Path, ref: str) -> str:
         return ref
 
     # Normalize accidental ..// segments
-    ref = re.sub(r"^\.\.//+", "/", ref)
+    ref = _DOTDOT_RE.sub("/", ref)
 
     # If it is a bare filename like 967A4321.jpg, assume it is in root
-    if "/" not in ref and ref.lower().endswith((".jpg", ".jpeg", ".png", ".webp", ".svg", ".gif", ".mp4", ".webm", ".pdf", ".css", ".js")):
-        return "/" + ref
+    if "/" not in ref:
+        parts = ref.rsplit(".", 1)
+        if len(parts) == 2 and "." + parts[1].lower() in ROOT_ASSET_EXTS:
+            return "/" + ref
 
     # Resolve relative path against current file, then convert to root-absolute
-    abs_target = (current_file.parent / ref).resolve()
+    resolved = _resolve_root(current_file.parent.as_posix(), ref, site_root_resolved.as_posix())
+    return ref if resolved is None else resolved
+
+@lru_cache(maxsize=8192)
+def _resolve_root(parent_str: str, ref: str, root_str: str):
+    """
+    Root-absolute posix path for ref relative to parent_str, or None if it
+    falls outside root_str. Cached: logos, favicons etc. repeat a lot.
+    parent_str and root_str are resolved posix paths.
+    """
+    # Without "..", plain string normalisation gives the same answer as
+    # resolve() (copytree leaves no symlinks in the build) and skips the syscalls
+    if ".." not in ref:
+        joined = posixpath.normpath(parent_str + "/" + ref)
+        if joined.startswith(root_str + "/"):
+            return joined[len(root_str):]
+
+    abs_target = (Path(parent_str) / ref).resolve()
     try:
-        rel = abs_target.relative_to(site_root.resolve())
+        rel = abs_target.relative_to(root_str)
     except Exception:
-        return ref
+        return None
 
     return "/" + rel.as_posix()
 
@@ -91,7 +220,7 @@ def normalise_internal_links(ref: str) -> str:
         return ref
 
     # Collapse duplicate slashes
-    ref = re.sub(r"//+", "/", ref)
+    ref = _DUPSLASH_RE.sub("/", ref)
 
     # Home
     if ref in {"index.html", "/index.html"}:
@@ -119,17 +248,74 @@ def normalise_internal_links(ref: str) -> str:
 
     return ref
 
-def plan_renames(site_root: Path, rename_assets: bool) -> dict:
+def _hs_audit(pattern: re.Pattern) -> tuple:
+    cached = _HS_AUDIT.get(pattern.pattern)
+    if cached is None:
+        src = pattern.pattern.encode("utf-8")
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[src],
+            ids=[0],
+            elements=1,
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST],
+        )
+        cached = _HS_AUDIT[pattern.pattern] = (db, re.compile(src))
+    return cached
+
+def _re2_audit(pattern: re.Pattern):
+    cached = _RE2_AUDIT.get(pattern.pattern)
+    if cached is None:
+        cached = _RE2_AUDIT[pattern.pattern] = re2.compile(pattern.pattern)
+    return cached
+
+def iter_audit_refs(s: str, pattern: re.Pattern, use_re2: bool = False):
+    """
+    Yield group(1) of each match of an audit pattern, like pattern.finditer.
+    With hyperscan installed, it finds the match starts in one pass and
+    the capture is only taken at those offsets. use_re2 runs the pattern on
+    google-re2 instead: linear time, but its per-match overhead makes it
+    slower than re on typical pages, so it is opt-in.
+    """
+    if use_re2:
+        for m in _re2_audit(pattern).finditer(s):
+            yield m.group(1)
+        return
+
+    if hyperscan is None:
+        for m in pattern.finditer(s):
+            yield m.group(1)
+        return
+
+    db, bpattern = _hs_audit(pattern)
+    data = s.encode("utf-8")
+    starts = []
+    db.scan(data, match_event_handler=lambda _id, start, _end, _flags, _ctx: starts.append(start))
+
+    # Keep finditer semantics: leftmost, non-overlapping
+    pos = 0
+    for start in sorted(set(starts)):
+        if start < pos:
+            continue
+        m = bpattern.match(data, start)
+        if m is None:
+            continue
+        pos = m.end()
+        yield m.group(1).decode("utf-8")
+
+def plan_renames(site_root: Path, rename_assets: bool, files: list = None) -> dict:
     """
     Plan file renames for case fixes and optional kebab-case normalization.
+    files is the pre-walked file list for site_root (walked here if omitted).
     Returns map old_rel -> new_rel (posix).
     """
     mapping = {}
+    used = set()  # mapping.values(), for O(1) collision checks
+    if files is None:
+        files = list_files(site_root)
 
-    for p in site_root.rglob("*"):
-        if not p.is_file():
-            continue
-        rel = p.relative_to(site_root).as_posix()
+    prefix = rel_prefix(site_root)
+    for p in files:
+        rel = rel_posix(p, prefix)
         parts = rel.split("/")
 
         # Do not rename dotfiles or Netlify control files
@@ -154,6 +340,10 @@ def plan_renames(site_root: Path, rename_assets: bool) -> dict:
         stem, ext = os.path.splitext(name)
         ext_lower = ext.lower()
 
+        # Already clean, so kebab() would not change it; skip the regex work
+        if ext == ext_lower and _KEBAB_CLEAN_RE.fullmatch(stem):
+            continue
+
         # Build new filename
         new_stem = kebab(stem)
         new_name = new_stem + ext_lower
@@ -166,15 +356,17 @@ def plan_renames(site_root: Path, rename_assets: bool) -> dict:
         new_rel = "/".join(new_parts)
 
         # Avoid collisions
-        if new_rel in mapping.values():
+        if new_rel in used:
             # If collision, skip kebab change, only fix extension
             new_name2 = stem + ext_lower
             new_rel2 = "/".join(parts[:-1] + [new_name2])
-            if new_rel2 != rel and new_rel2 not in mapping.values():
+            if new_rel2 != rel and new_rel2 not in used:
                 mapping[rel] = new_rel2
+                used.add(new_rel2)
             continue
 
         mapping[rel] = new_rel
+        used.add(new_rel)
 
     return mapping
 
@@ -185,6 +377,11 @@ def apply_renames(build_root: Path, rename_map: dict, dry_run: bool) -> None:
     # Do deeper paths first so we do not rename parent directories mid-walk
     items = sorted(rename_map.items(), key=lambda kv: kv[0].count("/"), reverse=True)
 
+    # Create each target folder once up front, not once per file
+    if not dry_run:
+        for d in {(build_root / new_rel).parent for _, new_rel in items}:
+            d.mkdir(parents=True, exist_ok=True)
+
     for old_rel, new_rel in items:
         old_p = build_root / old_rel
         new_p = build_root / new_rel
@@ -193,83 +390,199 @@ def apply_renames(build_root: Path, rename_map: dict, dry_run: bool) -> None:
         if dry_run:
             print(f"[DRY] RENAME {old_rel} -> {new_rel}")
             continue
-        new_p.parent.mkdir(parents=True, exist_ok=True)
         old_p.rename(new_p)
 
-def update_references_in_text(build_root: Path, rename_map: dict, dry_run: bool) -> None:
+def build_token_matcher(repl: dict):
     """
-    Update href/src/url references across all text files to:
-      - root-absolute
-      - cleaned internal routes
-      - renamed file targets
+    Build the matcher replace_tokens uses to find every old token in one pass.
+    Returns None when there is nothing to replace.
     """
-    # Build replacement dictionary for quick substitution
-    # We replace both relative and root-absolute occurrences when possible.
-    repl = {}
-
-    for old_rel, new_rel in rename_map.items():
-        old_abs = "/" + old_rel
-        new_abs = "/" + new_rel
-        repl[old_abs] = new_abs
-        repl[old_rel] = new_rel
-
-    for p in build_root.rglob("*"):
-        if not p.is_file():
-            continue
-        if not is_text_file(p):
+    if not repl:
+        return None
+
+    # Many needles: a trie matches them all in one linear scan
+    if ahocorasick is not None and len(repl) > AHOCORASICK_MIN_TOKENS:
+        automaton = ahocorasick.Automaton()
+        for old, new in repl.items():
+            automaton.add_word(old, (len(old), new))
+        automaton.make_automaton()
+        return automaton
+
+    # Longest first so a shorter old path cannot shadow a longer one that
+    # shares its prefix
+    keys = sorted(repl, key=len, reverse=True)
+    return re.compile("|".join(re.escape(k) for k in keys))
+
+def replace_tokens(txt: str, repl: dict, token_matcher) -> str:
+    """
+    Replace leftmost-longest, non-overlapping occurrences of repl keys.
+    """
+    if token_matcher is None:
+        return txt
+    if isinstance(token_matcher, re.Pattern):
+        return token_matcher.sub(lambda m: repl[m.group(0)], txt)
+
+    # Automaton.iter reports every (overlapping) hit; keep the longest at the
+    # leftmost start, as the regex alternation does. (iter_long misses hits
+    # at the very end of the text.)
+    hits = sorted((end - n + 1, -n, new) for end, (n, new) in token_matcher.iter(txt))
+    out = []
+    pos = 0
+    for start, neg_n, new in hits:
+        if start < pos:
             continue
+        out.append(txt[pos:start])
+        out.append(new)
+        pos = start - neg_n
+    if not out:
+        return txt
+    out.append(txt[pos:])
+    return "".join(out)
+
+def rewrite_refs(p: Path, raw: bytes, root_resolved_str: str, repl: dict, token_matcher):
+    """
+    Rewrite references in the raw contents of text file p.
+    Returns the new text, or None if nothing changed. Does no file I/O.
+    """
+    # With no renames, only href/src/url() can change, so skip files that have
+    # none without decoding them
+    if token_matcher is None and not REF_HINT_RE.search(raw):
+        return None
 
-        txt = read_text(p)
-        original = txt
+    root_resolved = Path(root_resolved_str)
+    # Resolve the containing folder once per file, not once per reference
+    current_file = p.parent.resolve() / p.name
 
+    txt = decode_text(raw)
+    original = txt
+
+    def _ref(m):
         # Update href/src
-        def _hs(m):
-            pre, val, end = m.group("attr"), m.group("val"), m.group("end")
+        if m.group("attr") is not None:
+            pre, val, end = m.group("attr"), m.group("hval"), m.group("hend")
             v = val.strip()
 
             # First, normalise internal links
             v = normalise_internal_links(v)
 
-            # Then, convert to root-absolute for local assets/pages
-            v = safe_rel_to_root(build_root, p, v)
-
-            # Then, apply rename mapping if applicable
-            if v in repl:
-                v = repl[v]
-
-            return pre + v + end
-
-        txt = HREFSRC_RE.sub(_hs, txt)
-
         # Update CSS url(...)
-        def _cu(m):
-            pre, val, end = m.group("pre"), m.group("val"), m.group("end")
+        else:
+            pre, val, end = m.group("pre"), m.group("cval"), m.group("cend")
             v = val.strip()
 
             if v.startswith(("http:", "https:", "data:")) or v.startswith("${"):
                 return pre + v + end
 
-            v = safe_rel_to_root(build_root, p, v)
-            if v in repl:
-                v = repl[v]
-            return pre + v + end
+        # Then, convert to root-absolute for local assets/pages
+        v = safe_rel_to_root(root_resolved, current_file, v)
+
+        # Then, apply rename mapping if applicable
+        if v in repl:
+            v = repl[v]
+
+        return pre + v + end
+
+    txt = REF_RE.sub(_ref, txt)
 
-        txt = CSSURL_RE.sub(_cu, txt)
+    # Also replace any raw string occurrences that exactly match old path tokens
+    # This helps with JSON blocks, OG images, etc.
+    txt = replace_tokens(txt, repl, token_matcher)
 
-        # Also replace any raw string occurrences that exactly match old path tokens
-        # This helps with JSON blocks, OG images, etc.
-        for k, v in repl.items():
-            txt = txt.replace(k, v)
+    return txt if txt != original else None
 
-        if txt != original:
-            if dry_run:
-                print(f"[DRY] UPDATE {p.relative_to(build_root).as_posix()}")
-            else:
-                write_text(p, txt)
+def _init_rewrite(root_resolved_str: str, repl: dict, token_matcher, dry_run: bool) -> None:
+    """
+    Pool initializer: store the shared rewrite context once per worker, so
+    only paths cross the process boundary per task.
+    """
+    global _rewrite_ctx
+    _rewrite_ctx = (root_resolved_str, repl, token_matcher, dry_run)
+
+def _rewrite_one(p: Path) -> tuple:
+    """
+    Rewrite references in a single text file, using the _init_rewrite context.
+    Returns (path, changed). Runs in a worker process, so keep it top-level.
+    """
+    root_resolved_str, repl, token_matcher, dry_run = _rewrite_ctx
+    txt = rewrite_refs(p, p.read_bytes(), root_resolved_str, repl, token_matcher)
+    if txt is not None and not dry_run:
+        write_text(p, txt)
+    return p, txt is not None
+
+async def _read_bytes_async(p: Path) -> bytes:
+    if aiofiles is None:
+        return await asyncio.to_thread(p.read_bytes)
+    async with aiofiles.open(p, "rb") as f:
+        return await f.read()
+
+async def _write_bytes_async(p: Path, data: bytes) -> None:
+    if aiofiles is None:
+        await asyncio.to_thread(p.write_bytes, data)
+        return
+    async with aiofiles.open(p, "wb") as f:
+        await f.write(data)
+
+async def _rewrite_one_async(p: Path, sem: asyncio.Semaphore, root_resolved_str: str, repl: dict, token_matcher, dry_run: bool) -> tuple:
+    async with sem:
+        raw = await _read_bytes_async(p)
+        txt = rewrite_refs(p, raw, root_resolved_str, repl, token_matcher)
+        if txt is not None and not dry_run:
+            await _write_bytes_async(p, txt.encode("utf-8", errors="ignore"))
+    return p, txt is not None
+
+async def _rewrite_all_async(paths: list, max_open: int, ctx: tuple) -> list:
+    # Overlap reads/writes of many files; the semaphore caps open descriptors
+    sem = asyncio.Semaphore(max_open)
+    return await asyncio.gather(*(_rewrite_one_async(p, sem, *ctx) for p in paths))
+
+def update_references_in_text(build_root: Path, rename_map: dict, dry_run: bool, jobs: int = None, files: list = None, async_io: bool = False) -> None:
+    """
+    Update href/src/url references across all text files to:
+      - root-absolute
+      - cleaned internal routes
+      - renamed file targets
+    Files are independent, so they are rewritten across worker processes,
+    or with overlapped asyncio I/O in one process when async_io is set.
+    files is the pre-walked file list for build_root (walked here if omitted).
+    """
+    # Build replacement dictionary for quick substitution
+    # We replace both relative and root-absolute occurrences when possible.
+    repl = {}
+
+    for old_rel, new_rel in rename_map.items():
+        old_abs = "/" + old_rel
+        new_abs = "/" + new_rel
+        repl[old_abs] = new_abs
+        repl[old_rel] = new_rel
+
+    token_matcher = build_token_matcher(repl)
+
+    if files is None:
+        files = list_files(build_root)
+    paths = [p for p in files if is_text_file(p)]
+    jobs = jobs or os.cpu_count() or 1
+    # Shared by every file: sent once per worker, not once per task
+    ctx = (str(build_root.resolve()), repl, token_matcher, dry_run)
+
+    if async_io:
+        results = asyncio.run(_rewrite_all_async(paths, max_open=64, ctx=ctx))
+    elif jobs > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(paths)), initializer=_init_rewrite, initargs=ctx) as ex:
+            results = list(ex.map(_rewrite_one, paths, chunksize=16))
+    else:
+        _init_rewrite(*ctx)
+        results = [_rewrite_one(p) for p in paths]
+
+    if dry_run:
+        prefix = rel_prefix(build_root)
+        lines = [f"[DRY] UPDATE {rel_posix(p, prefix)}" for p, changed in results if changed]
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
-def ensure_netlify_structure(build_root: Path, dry_run: bool) -> None:
+def ensure_netlify_structure(build_root: Path, dry_run: bool, existing: set = None) -> None:
     """
     Ensure required files exist and folder pages are correct.
+    existing is the set of relative posix file paths, if already known.
     """
     required = [
         "index.html",
@@ -288,7 +601,10 @@ def ensure_netlify_structure(build_root: Path, dry_run: bool) -> None:
         "events/index.html",
         "team/index.html",
     ]
-    missing = [r for r in required if not (build_root / r).exists()]
+    if existing is None:
+        missing = [r for r in required if not (build_root / r).exists()]
+    else:
+        missing = [r for r in required if r not in existing]
     if missing:
         print("Missing required files:")
         for m in missing:
@@ -296,12 +612,16 @@ def ensure_netlify_structure(build_root: Path, dry_run: bool) -> None:
         if not dry_run:
             print("Build continues, but deploy will be incomplete until you add them.")
 
-def tidy_redirects(build_root: Path, dry_run: bool) -> None:
+def tidy_redirects(build_root: Path, dry_run: bool, existing: set = None) -> None:
     """
     Make sure _redirects includes common legacy routes.
+    existing is the set of relative posix file paths, if already known.
     """
     redirects = build_root / "_redirects"
-    if not redirects.exists():
+    if existing is None:
+        if not redirects.exists():
+            return
+    elif "_redirects" not in existing:
         return
     s = read_text(redirects).splitlines()
 
@@ -327,13 +647,74 @@ def tidy_redirects(build_root: Path, dry_run: bool) -> None:
         else:
             write_text(redirects, out)
 
+def _clone_file(src: str, dst: str) -> bool:
+    """
+    Try a copy-on-write clone of src to dst. Returns False if unsupported.
+    """
+    if sys.platform.startswith("linux"):
+        import fcntl
+        with open(src, "rb") as fs, open(dst, "wb") as fd:
+            try:
+                fcntl.ioctl(fd.fileno(), FICLONE, fs.fileno())
+                return True
+            except OSError:
+                return False
+    if sys.platform == "darwin":
+        import ctypes
+        clonefile = getattr(ctypes.CDLL(None, use_errno=True), "clonefile", None)
+        if clonefile is None:
+            return False
+        return clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+    return False
+
+def reflink_copy(src: str, dst: str) -> str:
+    """
+    copy_function for copytree: reflink on btrfs/XFS/APFS, byte copy elsewhere.
+    """
+    global _reflink_supported
+    if _reflink_supported:
+        if _clone_file(src, dst):
+            shutil.copystat(src, dst)
+            return dst
+        # The whole tree sits on the same filesystems, so one failure means all fail
+        _reflink_supported = False
+    return shutil.copy2(src, dst)
+
 def copy_site(src: Path, dst: Path, dry_run: bool) -> None:
     if dst.exists():
         raise RuntimeError(f"Build output already exists: {dst}")
     if dry_run:
         print(f"[DRY] COPY {src} -> {dst}")
         return
-    shutil.copytree(src, dst)
+    shutil.copytree(src, dst, copy_function=reflink_copy)
+
+def audit_refs(build_root: Path, files: list, use_re2: bool = False) -> set:
+    """
+    Collect non-root local references left in html/css files.
+    Returns "rel_path<TAB>ref" lines.
+    """
+    bad = set()
+    prefix = rel_prefix(build_root)
+
+    for p in files:
+        if p.suffix.lower() not in {".html", ".css"}:
+            continue
+        rel = rel_posix(p, prefix)
+        s = read_text(p)
+        if p.suffix.lower() == ".html":
+            for v in iter_audit_refs(s, AUDIT_HREFSRC_RE, use_re2):
+                v = v.strip()
+                if v.startswith(SKIP_PREFIXES) or v.startswith("/") or v.startswith("${"):
+                    continue
+                bad.add(f"{rel}\t{v}")
+        else:
+            for v in iter_audit_refs(s, AUDIT_CSSURL_RE, use_re2):
+                v = v.strip()
+                if v.startswith(("http:", "https:", "data:")) or v.startswith("/"):
+                    continue
+                bad.add(f"{rel}\t{v}")
+
+    return bad
 
 def main():
     ap = argparse.ArgumentParser(description="Organise and normalise a Netlify static site (assets, links, filenames).")
@@ -342,8 +723,15 @@ def main():
     ap.add_argument("--dry-run", action="store_true", help="Print actions without writing changes")
     ap.add_argument("--rename-assets", action="store_true", help="Rename assets to kebab-case + lowercase extensions")
     ap.add_argument("--keep-out", action="store_true", help="Do not delete existing out folder if it exists")
+    ap.add_argument("--jobs", type=int, default=None, help="Worker processes for reference rewriting. Default is CPU count")
+    ap.add_argument("--audit-re2", action="store_true", help="Run the final audit on google-re2 (linear time, but usually slower than re)")
+    ap.add_argument("--async-io", action="store_true", help="Rewrite references with overlapped async I/O in one process instead of worker processes")
     args = ap.parse_args()
 
+    if args.audit_re2 and re2 is None:
+        print("--audit-re2 needs the google-re2 package")
+        sys.exit(1)
+
     site_root = Path(args.site_root).expanduser().resolve()
     if not site_root.exists():
         print("Site root not found:", site_root)
@@ -367,48 +755,34 @@ def main():
     # Copy original into build output
     copy_site(site_root, out, args.dry_run)
 
+    # Walk the build output once and reuse the listing for every phase
+    all_files = list_files(out)
+
     # Plan and apply renames
-    rename_map = plan_renames(site_root=out, rename_assets=args.rename_assets)
+    rename_map = plan_renames(site_root=out, rename_assets=args.rename_assets, files=all_files)
     if rename_map:
         print(f"Planned renames: {len(rename_map)}")
         apply_renames(out, rename_map, args.dry_run)
+        if not args.dry_run:
+            all_files = apply_map_to_files(out, all_files, rename_map)
     else:
         print("No renames planned.")
 
     # Update references across build output
-    update_references_in_text(out, rename_map, args.dry_run)
+    update_references_in_text(out, rename_map, args.dry_run, jobs=args.jobs, files=all_files, async_io=args.async_io)
 
     # Ensure required structure and redirects
-    ensure_netlify_structure(out, args.dry_run)
-    tidy_redirects(out, args.dry_run)
+    prefix = rel_prefix(out)
+    existing = {rel_posix(p, prefix) for p in all_files}
+    ensure_netlify_structure(out, args.dry_run, existing=existing)
+    tidy_redirects(out, args.dry_run, existing=existing)
 
     # Final simple audit: list non-root references in html/css
     print("\nFinal audit: non-root local refs (excluding ${...})")
-    bad = set()
-    href_src = re.compile(r'''(?:href|src)\s*=\s*["']([^"']+)["']''', re.I)
-    css_url  = re.compile(r'''url\(\s*["']?([^"')]+)["']?\s*\)''', re.I)
-
-    for p in out.rglob("*"):
-        if not p.is_file():
-            continue
-        if p.suffix.lower() not in {".html", ".css"}:
-            continue
-        s = read_text(p)
-        if p.suffix.lower() == ".html":
-            for m in href_src.finditer(s):
-                v = m.group(1).strip()
-                if v.startswith(SKIP_PREFIXES) or v.startswith("/") or v.startswith("${"):
-                    continue
-                bad.add(f"{p.relative_to(out).as_posix()}\t{v}")
-        else:
-            for m in css_url.finditer(s):
-                v = m.group(1).strip()
-                if v.startswith(("http:", "https:", "data:")) or v.startswith("/"):
-                    continue
-                bad.add(f"{p.relative_to(out).as_posix()}\t{v}")
+    bad = audit_refs(out, all_files, use_re2=args.audit_re2)
 
-    for line in sorted(bad):
-        print(line)
+    if bad:
+        sys.stdout.write("\n".join(sorted(bad)) + "\n")
 
     if not bad:
         print("OK. No non-root local refs found (excluding templates).")
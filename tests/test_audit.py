@@ -0,0 +1,52 @@
+import unittest
+from unittest import mock
+
+import organise_site
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Whitespace and letter-case edge cases the audit backends used to disagree on
+EDGE_HTML = (
+    'x href=\xa0"nbsp.png" HREF="upper.png" src\x0b=\x0c"vtab.png" '
+    'ſrc="long-s.png" href="caf\xe9.png" src=\'\' href="a"b"'
+)
+EDGE_CSS = 'url(\x0b"vtab.png") URL( "upper.png" ) url(\xa0nbsp.png) url(url(a) url(Kelvin.png)'
+
+
+def audit(s, pattern, hs=None, use_re2=False):
+    with mock.patch.object(organise_site, "hyperscan", hs):
+        return list(organise_site.iter_audit_refs(s, pattern, use_re2))
+
+
+class AuditBackendTest(unittest.TestCase):
+    def expected(self, s, pattern):
+        return [m.group(1) for m in pattern.finditer(s)]
+
+    def test_stdlib_matches_finditer(self):
+        for s, pattern in ((EDGE_HTML, organise_site.AUDIT_HREFSRC_RE), (EDGE_CSS, organise_site.AUDIT_CSSURL_RE)):
+            self.assertEqual(audit(s, pattern), self.expected(s, pattern))
+
+    @unittest.skipIf(hyperscan is None, "hyperscan not installed")
+    def test_hyperscan_matches_stdlib(self):
+        for s, pattern in ((EDGE_HTML, organise_site.AUDIT_HREFSRC_RE), (EDGE_CSS, organise_site.AUDIT_CSSURL_RE)):
+            self.assertEqual(audit(s, pattern, hs=hyperscan), audit(s, pattern))
+
+    @unittest.skipIf(re2 is None, "google-re2 not installed")
+    def test_re2_matches_stdlib(self):
+        for s, pattern in ((EDGE_HTML, organise_site.AUDIT_HREFSRC_RE), (EDGE_CSS, organise_site.AUDIT_CSSURL_RE)):
+            self.assertEqual(audit(s, pattern, use_re2=True), audit(s, pattern))
+
+    def test_whitespace_and_case_are_ascii_only(self):
+        self.assertEqual(audit(EDGE_HTML, organise_site.AUDIT_HREFSRC_RE), ["upper.png", "vtab.png", "caf\xe9.png", "a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import organise_site
+
+
+class RelPathTest(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name).resolve()
+        for rel in ("Top Photo.png", "img/Foo--Bar 20.jpeg", "img/ok.png", "about/index.html"):
+            (self.root / rel).parent.mkdir(parents=True, exist_ok=True)
+            (self.root / rel).write_bytes(b"")
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def check_root(self, root):
+        files = organise_site.list_files(root)
+        prefix = organise_site.rel_prefix(root)
+        self.assertEqual(
+            sorted(organise_site.rel_posix(p, prefix) for p in files),
+            sorted(p.relative_to(root).as_posix() for p in files),
+        )
+        self.assertEqual(
+            organise_site.plan_renames(root, rename_assets=False),
+            {"Top Photo.png": "Top-Photo.png", "img/Foo--Bar 20.jpeg": "img/Foo-Bar-20.jpeg"},
+        )
+
+    def test_absolute_root(self):
+        self.check_root(self.root)
+
+    def test_relative_root(self):
+        os.chdir(self.root)
+        self.check_root(Path("."))
+
+    def test_relative_subdir_root(self):
+        os.chdir(self.root.parent)
+        self.check_root(Path("./" + self.root.name))
+
+
+if __name__ == "__main__":
+    unittest.main()